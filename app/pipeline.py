@@ -16,12 +16,12 @@ import time
 from configs.config import config
 from modules.audio_processor import audio_processor
 from modules.prosody_emotion import prosody_detector
-from modules.speech_to_text import transcriber
-from modules.text_emotion import text_analyzer
+from modules.speech_to_text import _default_transcriber
+from modules.text_emotion import _default_analyzer
 from modules.emotion_fusion import emotion_fusion, FusedEmotionResult
-from modules.wellness_engine import wellness_engine, WellnessSuggestion
+from modules.wellness_engine import _default_engine, WellnessSuggestion
 from modules.response_generator import response_generator, ResponseContext
-from modules.text_to_speech import emotion_tts
+from modules.text_to_speech import _default_tts
 from modules.safety_checker import safety_checker, SafetyCheckResult
 
 
@@ -78,19 +78,34 @@ class WellnessPipeline:
     def __init__(self):
         logger.info("Initializing Mental Wellness Pipeline...")
         
-        # All modules are singletons, already initialized
+        # All modules are singletons, already initialized; the costly
+        # ones (STT, text analysis, wellness, TTS) are properties below
         self.audio_processor = audio_processor
         self.prosody_detector = prosody_detector
-        self.transcriber = transcriber
-        self.text_analyzer = text_analyzer
         self.emotion_fusion = emotion_fusion
-        self.wellness_engine = wellness_engine
         self.response_generator = response_generator
-        self.tts = emotion_tts
         self.safety_checker = safety_checker
         
         logger.info("Pipeline initialized successfully")
     
+    # Resolved on first use, so importing the pipeline doesn't load
+    # Whisper, the text model client, the suggestion index or a TTS engine
+    @property
+    def transcriber(self):
+        return _default_transcriber()
+    
+    @property
+    def text_analyzer(self):
+        return _default_analyzer()
+    
+    @property
+    def wellness_engine(self):
+        return _default_engine()
+    
+    @property
+    def tts(self):
+        return _default_tts()
+    
     async def process(self, audio_path: str) -> PipelineResult:
         """
         Process audio through the complete wellness pipeline.
@@ -120,14 +135,17 @@ class WellnessPipeline:
         # ========================================
         logger.info("Step 2: Voice emotion detection + Speech-to-text (parallel)")
         
-        # Run prosody detection and transcription in parallel
-        voice_emotion_task = self.prosody_detector.detect_emotion_from_file(processed_path)
-        
-        # Transcription (synchronous but fast)
-        transcription = self.transcriber.transcribe_multilingual(processed_path)
-        
-        # Get voice emotion result
-        voice_emotion = await voice_emotion_task
+        # Run prosody detection and transcription in parallel.
+        # Whisper is synchronous, so it decodes in a worker thread. The
+        # local prosody models also block the loop while they run, so
+        # the thread is submitted before prosody starts, not scheduled
+        # as a task that would only get to run once prosody finished.
+        loop = asyncio.get_running_loop()
+        stt_future = loop.run_in_executor(
+            None, self.transcriber.transcribe_multilingual, processed_path
+        )
+        voice_emotion = await self.prosody_detector.detect_emotion_from_file(processed_path)
+        transcription = await stt_future
         
         logger.info(f"Transcription: '{transcription.text[:100]}...'")
         logger.info(f"Voice emotion: {voice_emotion.primary_emotion} ({voice_emotion.confidence:.2f})")
@@ -205,7 +223,7 @@ class WellnessPipeline:
         # ========================================
         logger.info("Step 8: Text-to-speech synthesis")
         
-        response_audio_path = self.tts.synthesize(
+        response_audio_path = await self.tts.synthesize_async(
             text=empathetic_response,
             emotion=fused_emotion.primary_emotion
         )
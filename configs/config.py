@@ -59,6 +59,7 @@ class EmotionConfig:
 class TTSConfig:
     """Text-to-Speech configuration."""
     model_name: str = "tts_models/en/ljspeech/tacotron2-DDC"
+    device: str = "auto"  # "auto", "cuda" or "cpu" (Coqui only)
     
     # Emotion-based voice settings
     emotion_voice_settings: Dict[str, Dict] = field(default_factory=lambda: {
@@ -2,14 +2,15 @@
 Mental Wellness Companion - Modules
 """
 
+import importlib
+
 from .audio_processor import audio_processor, AudioProcessor
 from .prosody_emotion import prosody_detector, EmotionResult
-from .speech_to_text import transcriber, TranscriptionResult
-from .text_emotion import text_analyzer, TextEmotionResult
+from .speech_to_text import TranscriptionResult
+from .text_emotion import TextEmotionResult
 from .emotion_fusion import emotion_fusion, FusedEmotionResult
-from .wellness_engine import wellness_engine, WellnessSuggestion
+from .wellness_engine import WellnessSuggestion
 from .response_generator import response_generator, ResponseContext
-from .text_to_speech import emotion_tts
 from .safety_checker import safety_checker, SafetyCheckResult
 
 __all__ = [
@@ -30,4 +31,19 @@ __all__ = [
     "WellnessSuggestion",
     "ResponseContext",
     "SafetyCheckResult"
-]
\ No newline at end of file
+]
+
+# Singletons that are costly to build are created on first attribute access
+_LAZY_SINGLETONS = {
+    "transcriber": ".speech_to_text",
+    "text_analyzer": ".text_emotion",
+    "emotion_tts": ".text_to_speech",
+    "wellness_engine": ".wellness_engine",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_SINGLETONS:
+        module = importlib.import_module(_LAZY_SINGLETONS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,8 @@ Formula: Final = 0.65 × Voice + 0.35 × Text
 """
 
 from typing import Dict, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntEnum
 from loguru import logger
 
 from configs.config import config
@@ -13,6 +14,23 @@ from modules.prosody_emotion import EmotionResult
 from modules.text_emotion import TextEmotionResult
 
 
+class Intensity(IntEnum):
+    """Ordered intensity levels, comparable as integers."""
+    LOW = 0
+    MILD = 1
+    MODERATE = 2
+    HIGH = 3
+    CRISIS = 4
+    
+    @classmethod
+    def from_level(cls, level: str) -> "Intensity":
+        """Map an intensity level string to its rank (unknown -> LOW)."""
+        return _INTENSITY_BY_LEVEL.get(level, cls.LOW)
+
+
+_INTENSITY_BY_LEVEL = {member.name.lower(): member for member in Intensity}
+
+
 @dataclass
 class FusedEmotionResult:
     """Container for fused emotion analysis."""
@@ -20,11 +38,17 @@ class FusedEmotionResult:
     confidence: float
     all_emotions: Dict[str, float]
     intensity: float
-    intensity_level: str  # mild, moderate, high, crisis
+    intensity_level: str  # low, mild, moderate, high, crisis
     voice_contribution: Dict[str, float]
     text_contribution: Dict[str, float]
     key_phrases: list
     requires_crisis_response: bool
+    
+    # Integer rank of intensity_level, for ordered comparisons
+    intensity_rank: Intensity = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.intensity_rank = Intensity.from_level(self.intensity_level)
 
 
 class EmotionFusion:
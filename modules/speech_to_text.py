@@ -15,11 +15,14 @@ MODEL ACCURACY COMPARISON:
 For ChatGPT-level quality, we use 'large' or 'large-v3'
 """
 
+import functools
+import math
 import os
 import warnings
 from typing import Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
+import numpy as np
 from loguru import logger
 
 # Suppress warnings
@@ -55,6 +58,7 @@ class HighQualityTranscriber:
         self.model_name = None
         self.device = "cpu"
         self.is_available = False
+        self._copy_stream = None  # CUDA stream for host->device audio uploads
         
         self._load_model()
     
@@ -67,6 +71,7 @@ class HighQualityTranscriber:
             # Determine device
             if torch.cuda.is_available():
                 self.device = "cuda"
+                self._copy_stream = torch.cuda.Stream()
                 logger.info("🚀 Using CUDA GPU for Whisper")
             elif hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
                 self.device = "mps"
@@ -132,6 +137,29 @@ class HighQualityTranscriber:
             logger.error("Whisper not installed! Run: pip install openai-whisper")
             self.is_available = False
     
+    def _load_audio_to_device(self, audio_path: str):
+        """
+        Decode audio into page-locked memory and upload it to the GPU.
+        
+        Pinned memory lets the copy run as an async DMA on a side stream;
+        the compute stream waits on it, so the mel spectrogram and encoder
+        start as soon as the samples land.
+        """
+        import torch
+        import whisper
+        
+        audio = whisper.load_audio(audio_path)  # float32, 16 kHz mono
+        pinned = torch.empty(audio.shape[0], dtype=torch.float32, pin_memory=True)
+        pinned.numpy()[:] = audio
+        
+        with torch.cuda.stream(self._copy_stream):
+            audio_gpu = pinned.to(self.device, non_blocking=True)
+        
+        compute_stream = torch.cuda.current_stream()
+        compute_stream.wait_stream(self._copy_stream)
+        audio_gpu.record_stream(compute_stream)
+        return audio_gpu
+    
     def _get_accuracy(self, model_name: str) -> str:
         """Get expected accuracy for model."""
         accuracy_map = {
@@ -148,7 +176,8 @@ class HighQualityTranscriber:
     def transcribe(
         self,
         audio_path: str,
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        word_timestamps: bool = False
     ) -> TranscriptionResult:
         """
         Transcribe audio with HIGH ACCURACY settings.
@@ -156,6 +185,7 @@ class HighQualityTranscriber:
         Args:
             audio_path: Path to audio file
             language: Language code (e.g., 'en', 'es') or None for auto-detect
+            word_timestamps: Run Whisper's word alignment pass (slower)
             
         Returns:
             TranscriptionResult with text, language, confidence
@@ -200,8 +230,8 @@ class HighQualityTranscriber:
                 # Use previous context for better accuracy
                 "condition_on_previous_text": True,
                 
-                # Word-level timestamps
-                "word_timestamps": True,
+                # Word-level timestamps (extra alignment pass, off by default)
+                "word_timestamps": word_timestamps,
                 
                 # Compression ratio threshold (filter bad segments)
                 "compression_ratio_threshold": 2.4,
@@ -220,8 +250,17 @@ class HighQualityTranscriber:
             if language:
                 transcribe_options["language"] = language
             
+            # On GPU, hand Whisper a device tensor so the mel spectrogram
+            # is computed on-device from a pinned, async upload
+            audio = audio_path
+            if self.device == "cuda":
+                try:
+                    audio = self._load_audio_to_device(audio_path)
+                except Exception as e:
+                    logger.warning(f"Pinned audio upload failed, using file path: {e}")
+            
             # Transcribe
-            result = self.model.transcribe(audio_path, **transcribe_options)
+            result = self.model.transcribe(audio, **transcribe_options)
             
             # Extract text
             text = result.get("text", "").strip()
@@ -231,11 +270,13 @@ class HighQualityTranscriber:
             segments = result.get("segments", [])
             if segments:
                 # Average probability across segments
-                avg_prob = sum(
-                    seg.get("avg_logprob", -1) for seg in segments
-                ) / len(segments)
+                log_probs = np.fromiter(
+                    (seg.get("avg_logprob", -1.0) for seg in segments),
+                    dtype=np.float32,
+                    count=len(segments)
+                )
+                avg_prob = float(log_probs.mean())
                 # Convert log probability to confidence (0-1)
-                import math
                 confidence = math.exp(avg_prob) if avg_prob > -10 else 0.5
                 confidence = min(1.0, max(0.0, confidence))
             else:
@@ -364,7 +405,28 @@ class FasterWhisperTranscriber:
             logger.info("faster-whisper not installed (optional)")
             self.is_available = False
     
-    def transcribe(self, audio_path: str, language: Optional[str] = None) -> TranscriptionResult:
+    def _transcribe_options(self, language: Optional[str], word_timestamps: bool) -> dict:
+        """High accuracy decoding settings for faster-whisper."""
+        return dict(
+            language=language,
+            word_timestamps=word_timestamps,
+            beam_size=5,
+            best_of=5,
+            temperature=(0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+            condition_on_previous_text=True,
+            vad_filter=True,  # Voice Activity Detection
+            vad_parameters=dict(
+                min_silence_duration_ms=500,
+                speech_pad_ms=400,
+            ),
+        )
+    
+    def transcribe(
+        self,
+        audio_path: str,
+        language: Optional[str] = None,
+        word_timestamps: bool = False
+    ) -> TranscriptionResult:
         """Transcribe using faster-whisper."""
         if not self.is_available:
             return TranscriptionResult(
@@ -378,16 +440,7 @@ class FasterWhisperTranscriber:
             # Transcribe with high accuracy settings
             segments, info = self.model.transcribe(
                 audio_path,
-                language=language,
-                beam_size=5,
-                best_of=5,
-                temperature=(0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
-                condition_on_previous_text=True,
-                vad_filter=True,  # Voice Activity Detection
-                vad_parameters=dict(
-                    min_silence_duration_ms=500,
-                    speech_pad_ms=400,
-                ),
+                **self._transcribe_options(language, word_timestamps)
             )
             
             # Collect text from segments
@@ -419,6 +472,143 @@ class FasterWhisperTranscriber:
                 confidence=0.0,
                 segments=[]
             )
+    
+class ONNXWhisperTranscriber:
+    """
+    GPU option: Whisper exported to ONNX, run on ONNX Runtime CUDA.
+    
+    Uses IOBinding so the encoder output and decoder KV cache stay on the
+    GPU across decoder steps instead of round-tripping through host memory.
+    
+    Export: optimum-cli export onnx --model openai/whisper-large-v3 whisper_onnx/
+    Install: pip install optimum[onnxruntime-gpu]
+    Set WHISPER_ONNX_DIR to use a different export directory.
+    """
+    
+    def __init__(self):
+        self.pipe = None
+        self.model_name = None
+        self.model_dir = os.environ.get("WHISPER_ONNX_DIR", "whisper_onnx")
+        self.is_available = False
+        
+        self._load_model()
+    
+    def _load_model(self):
+        """Load the exported ONNX Whisper model with CUDA IOBinding."""
+        try:
+            import torch
+            from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+            from transformers import AutoProcessor, pipeline
+        except ImportError:
+            logger.info("optimum[onnxruntime-gpu] not installed (optional)")
+            self.is_available = False
+            return
+        
+        if not torch.cuda.is_available():
+            logger.info("ONNX Whisper skipped (IOBinding requires a CUDA GPU)")
+            self.is_available = False
+            return
+        
+        if not Path(self.model_dir).is_dir():
+            logger.info(f"ONNX Whisper export not found: {self.model_dir}")
+            self.is_available = False
+            return
+        
+        try:
+            logger.info(f"Loading ONNX Whisper from {self.model_dir}...")
+            
+            model = ORTModelForSpeechSeq2Seq.from_pretrained(
+                self.model_dir,
+                provider="CUDAExecutionProvider",
+                use_io_binding=True
+            )
+            processor = AutoProcessor.from_pretrained(self.model_dir)
+            
+            self.pipe = pipeline(
+                "automatic-speech-recognition",
+                model=model,
+                tokenizer=processor.tokenizer,
+                feature_extractor=processor.feature_extractor,
+                chunk_length_s=30
+            )
+            self.model_name = Path(self.model_dir).name
+            self.is_available = True
+            
+            logger.info(f"✅ ONNX Whisper '{self.model_name}' loaded (CUDA + IOBinding)!")
+            
+        except Exception as e:
+            logger.warning(f"Could not load ONNX Whisper: {e}")
+            self.is_available = False
+    
+    def transcribe(
+        self,
+        audio_path: str,
+        language: Optional[str] = None,
+        word_timestamps: bool = False
+    ) -> TranscriptionResult:
+        """Transcribe using ONNX Runtime."""
+        if not self.is_available:
+            return TranscriptionResult(
+                text="[ONNX Whisper not available]",
+                language="unknown",
+                confidence=0.0,
+                segments=[]
+            )
+        
+        if not os.path.exists(audio_path):
+            logger.error(f"Audio file not found: {audio_path}")
+            return TranscriptionResult(
+                text="[Audio file not found]",
+                language="unknown",
+                confidence=0.0,
+                segments=[]
+            )
+        
+        try:
+            generate_kwargs = {"task": "transcribe"}
+            if language:
+                generate_kwargs["language"] = language
+            
+            result = self.pipe(
+                audio_path,
+                return_timestamps="word" if word_timestamps else True,
+                generate_kwargs=generate_kwargs
+            )
+            
+            all_segments = []
+            for chunk in result.get("chunks", []):
+                start, end = chunk["timestamp"]
+                all_segments.append({
+                    "start": start,
+                    "end": end,
+                    "text": chunk["text"],
+                })
+            
+            # The HF pipeline exposes neither token log-probs nor the
+            # detected language, so report the same defaults as Whisper
+            return TranscriptionResult(
+                text=result.get("text", "").strip(),
+                language=language or "unknown",
+                confidence=0.8,
+                segments=all_segments
+            )
+            
+        except Exception as e:
+            logger.error(f"ONNX Whisper error: {e}")
+            return TranscriptionResult(
+                text="[Transcription failed]",
+                language="unknown",
+                confidence=0.0,
+                segments=[]
+            )
+    
+    def transcribe_multilingual(self, audio_path: str) -> TranscriptionResult:
+        """Transcribe with automatic language detection."""
+        return self.transcribe(audio_path, language=None)
+    
+    def transcribe_english(self, audio_path: str) -> TranscriptionResult:
+        """Transcribe assuming English language."""
+        return self.transcribe(audio_path, language="en")
 
 
 # =============================================
@@ -430,7 +620,9 @@ def get_transcriber():
     
     Priority:
     1. faster-whisper (if installed) - 4x faster, same quality
-    2. OpenAI Whisper - standard, reliable
+    2. ONNX Whisper (CUDA + exported model) - IOBinding keeps tensors on GPU,
+       but reports a fixed confidence and no detected language
+    3. OpenAI Whisper - standard, reliable
     """
     # Try faster-whisper first
     faster = FasterWhisperTranscriber()
@@ -438,29 +630,50 @@ def get_transcriber():
         logger.info("Using faster-whisper (4x faster)")
         return faster
     
+    # Then ONNX Runtime on GPU
+    onnx = ONNXWhisperTranscriber()
+    if onnx.is_available:
+        logger.info("Using ONNX Whisper (CUDA IOBinding)")
+        return onnx
+    
     # Fall back to OpenAI Whisper
     logger.info("Using OpenAI Whisper")
     return HighQualityTranscriber()
 
 
 # =============================================
-# Singleton instance
+# Singleton instance (loaded on first use)
 # =============================================
-transcriber = get_transcriber()
+@functools.cache
+def _default_transcriber():
+    """Shared transcriber, created on first use instead of at import."""
+    return get_transcriber()
+
+
+def __getattr__(name):
+    # `transcriber` stays importable without loading Whisper at import time
+    if name == "transcriber":
+        return _default_transcriber()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================
 # Convenience function
 # =============================================
-def transcribe_audio(audio_path: str, language: Optional[str] = None) -> TranscriptionResult:
+def transcribe_audio(
+    audio_path: str,
+    language: Optional[str] = None,
+    word_timestamps: bool = False
+) -> TranscriptionResult:
     """
     Transcribe audio file with ChatGPT-level accuracy.
     
     Args:
         audio_path: Path to audio file
         language: Language code or None for auto-detect
+        word_timestamps: Include word-level timestamps (slower)
         
     Returns:
         TranscriptionResult
     """
-    return transcriber.transcribe(audio_path, language)
\ No newline at end of file
+    return _default_transcriber().transcribe(audio_path, language, word_timestamps)
\ No newline at end of file
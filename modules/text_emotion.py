@@ -4,6 +4,9 @@ Secondary emotion source - analyzes WHAT the user said
 Complements prosody analysis which captures HOW they said it
 """
 
+import asyncio
+import bisect
+import functools
 import os
 import re
 from typing import Dict, Optional, List
@@ -12,6 +15,33 @@ from loguru import logger
 
 from configs.config import config
 
+# Prefer RE2 (linear-time matching) for patterns run over raw user text
+try:
+    import re2 as _user_re
+except ImportError:
+    _user_re = re
+
+# Key phrase patterns, compiled once at import
+_FEEL_RE = _user_re.compile(r"i (?:feel|am|'m) (\w+(?:\s+\w+)?)")
+_SO_RE = _user_re.compile(r"so (\w+)")
+
+# Keyword analysis modifiers
+_WORD_RE = re.compile(r"[\w']+")
+_INTENSIFIERS = frozenset([
+    "very", "really", "so", "extremely", "incredibly", "terribly", "absolutely", "completely"
+])
+_DIMINISHERS_RE = re.compile("|".join(map(re.escape, [
+    "a bit", "slightly", "somewhat", "a little", "kind of", "sort of"
+])))
+_NEGATION_WORDS = (
+    "not", "never", "no", "don't", "doesn't", "didn't", "won't", "wouldn't",
+    "can't", "couldn't", "isn't", "aren't"
+)
+# Longest first so e.g. "not" wins over "no" at the same offset
+_NEGATION_RE = re.compile(
+    "|".join(re.escape(w) for w in sorted(_NEGATION_WORDS, key=len, reverse=True))
+)
+
 
 @dataclass
 class TextEmotionResult:
@@ -70,6 +100,21 @@ class TextEmotionAnalyzer:
                 "can't do", "failing", "struggle"
             ]
         }
+        self.emotion_keywords = {
+            emotion: frozenset(keywords)
+            for emotion, keywords in self.emotion_keywords.items()
+        }
+        
+        # Whole-word keywords as sets for O(1) token lookup;
+        # multi-word phrases still need a substring check
+        self._keyword_sets = {
+            emotion: frozenset(kw for kw in keywords if " " not in kw)
+            for emotion, keywords in self.emotion_keywords.items()
+        }
+        self._keyword_phrases = {
+            emotion: tuple(kw for kw in keywords if " " in kw)
+            for emotion, keywords in self.emotion_keywords.items()
+        }
     
     def _init_client(self):
         """Initialize OpenAI client for accurate emotion detection."""
@@ -133,7 +178,10 @@ Respond ONLY with a JSON object (no markdown, no explanation):
 
 Focus on emotional indicators, not just keywords. Consider context and implied feelings."""
 
-        response = self.openai_client.chat.completions.create(
+        # Run the blocking HTTP call in a worker thread so concurrent
+        # analyses don't serialize on the event loop
+        response = await asyncio.to_thread(
+            self.openai_client.chat.completions.create,
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             max_tokens=500,
@@ -167,59 +215,82 @@ Focus on emotional indicators, not just keywords. Consider context and implied f
         Handles intensity modifiers and negation patterns.
         """
         text_lower = text.lower()
-        emotion_scores = {}
         
-        # Intensity modifiers
-        intensifiers = ["very", "really", "so", "extremely", "incredibly", "terribly", "absolutely", "completely"]
-        diminishers = ["a bit", "slightly", "somewhat", "a little", "kind of", "sort of"]
+        # First offset of every word; its keys double as the token set
+        first_pos = {}
+        for match in _WORD_RE.finditer(text_lower):
+            first_pos.setdefault(match.group(), match.start())
+        tokens = first_pos.keys()
+        emotion_scores = {}
         
-        # Check for intensifiers
+        # Check for intensifiers / diminishers
         intensity_boost = 1.0
-        for word in intensifiers:
-            if word in text_lower:
-                intensity_boost = 1.3
-                break
-        for phrase in diminishers:
-            if phrase in text_lower:
-                intensity_boost = 0.7
-                break
+        if not _INTENSIFIERS.isdisjoint(tokens):
+            intensity_boost = 1.3
+        if _DIMINISHERS_RE.search(text_lower):
+            intensity_boost = 0.7
+        
+        # Fast path: short utterances without negation only need
+        # keyword membership, not negation scope or position weighting
+        if len(tokens) <= 3 and not _NEGATION_RE.search(text_lower):
+            for emotion, keyword_set in self._keyword_sets.items():
+                hits = len(tokens & keyword_set) + sum(
+                    1 for phrase in self._keyword_phrases[emotion] if phrase in text_lower
+                )
+                if hits:
+                    emotion_scores[emotion] = min(1.0, hits * intensity_boost / 2.5)
+            return self._build_keyword_result(text, emotion_scores)
+        
+        # Negation positions, found in a single pass (sorted by offset)
+        neg_starts = []
+        neg_ends = []
+        for match in _NEGATION_RE.finditer(text_lower):
+            neg_starts.append(match.start())
+            neg_ends.append(match.end())
         
-        # Negation patterns
-        negation_words = ["not", "never", "no", "don't", "doesn't", "didn't", "won't", "wouldn't", "can't", "couldn't", "isn't", "aren't"]
-        has_negation = any(neg in text_lower for neg in negation_words)
+        text_len = max(len(text_lower), 1)
         
-        for emotion, keywords in self.emotion_keywords.items():
+        for emotion, keyword_set in self._keyword_sets.items():
             score = 0
-            matched_keywords = []
             
-            for keyword in keywords:
-                if keyword in text_lower:
-                    # Check if negated
-                    is_negated = False
-                    if has_negation:
-                        # Simple check: negation word within 3 words before keyword
-                        pos = text_lower.find(keyword)
-                        if pos > 0:
-                            prefix = text_lower[max(0, pos-25):pos]
-                            is_negated = any(neg in prefix for neg in negation_words)
-                    
-                    if is_negated:
-                        # Negated emotion - flip to opposite
-                        if emotion == "joy":
-                            emotion_scores["sadness"] = emotion_scores.get("sadness", 0) + 0.3
-                        elif emotion in ["sadness", "anger", "fear", "anxiety"]:
-                            emotion_scores["neutral"] = emotion_scores.get("neutral", 0) + 0.2
-                    else:
-                        # Weight by keyword position (earlier = stronger)
-                        pos = text_lower.find(keyword)
-                        weight = 1.0 - (pos / max(len(text_lower), 1)) * 0.3
-                        score += weight * intensity_boost
-                        matched_keywords.append(keyword)
+            # Offsets of matched keywords: words by token lookup,
+            # multi-word phrases by substring search
+            positions = [first_pos[keyword] for keyword in tokens & keyword_set]
+            for phrase in self._keyword_phrases[emotion]:
+                pos = text_lower.find(phrase)
+                if pos >= 0:
+                    positions.append(pos)
+            
+            for pos in positions:
+                # Nearest negation ending before the keyword, within 25 chars
+                is_negated = False
+                if neg_ends:
+                    i = bisect.bisect_right(neg_ends, pos) - 1
+                    is_negated = i >= 0 and neg_starts[i] >= pos - 25
+                
+                if is_negated:
+                    # Negated emotion - flip to opposite
+                    if emotion == "joy":
+                        emotion_scores["sadness"] = emotion_scores.get("sadness", 0) + 0.3
+                    elif emotion in ["sadness", "anger", "fear", "anxiety"]:
+                        emotion_scores["neutral"] = emotion_scores.get("neutral", 0) + 0.2
+                else:
+                    # Weight by keyword position (earlier = stronger)
+                    weight = 1.0 - (pos / text_len) * 0.3
+                    score += weight * intensity_boost
             
             # Normalize score
             if score > 0:
                 emotion_scores[emotion] = min(1.0, score / 2.5)
         
+        return self._build_keyword_result(text, emotion_scores)
+    
+    def _build_keyword_result(
+        self,
+        text: str,
+        emotion_scores: Dict[str, float]
+    ) -> TextEmotionResult:
+        """Turn raw keyword scores into a TextEmotionResult."""
         # Ensure all emotions have a score
         for emotion in ["sadness", "anger", "fear", "anxiety", "joy", "neutral"]:
             if emotion not in emotion_scores:
@@ -261,15 +332,14 @@ Focus on emotional indicators, not just keywords. Consider context and implied f
     def _extract_key_phrases(self, text: str) -> List[str]:
         """Extract emotionally significant phrases."""
         phrases = []
+        text_lower = text.lower()
         
         # Look for "I feel" statements
-        feel_pattern = r"i (?:feel|am|'m) (\w+(?:\s+\w+)?)"
-        matches = re.findall(feel_pattern, text.lower())
+        matches = _FEEL_RE.findall(text_lower)
         phrases.extend(matches[:3])
         
         # Look for "so" intensifiers
-        so_pattern = r"so (\w+)"
-        matches = re.findall(so_pattern, text.lower())
+        matches = _SO_RE.findall(text_lower)
         phrases.extend(matches[:2])
         
         return list(set(phrases))[:5]
@@ -285,5 +355,16 @@ Focus on emotional indicators, not just keywords. Consider context and implied f
         )
 
 
-# Singleton instance
-text_analyzer = TextEmotionAnalyzer()
+# Singleton instance (created on first use)
+@functools.cache
+def _default_analyzer() -> TextEmotionAnalyzer:
+    """Shared analyzer, created on first use instead of at import."""
+    return TextEmotionAnalyzer()
+
+
+def __getattr__(name):
+    # `text_analyzer` stays importable without building the client at import time
+    if name == "text_analyzer":
+        return _default_analyzer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
@@ -2,9 +2,11 @@
 Emotion-Aware Text-to-Speech Module - FIXED VERSION
 ====================================================
 FIXES:
-- Generates UNIQUE audio file for each request (no caching)
-- Uses timestamp + random ID in filename
+- Generates UNIQUE audio file for each request
+- Uses a random ID in filename
 - Cleans up old TTS files
+- Repeated (text, emotion) requests reuse the synthesized audio
+  from an in-memory LRU, still written to a new unique file
 
 EMPATHETIC TTS RESPONSE RULES:
 - SAD/DEPRESSED: Speak softly, gently, and reassuringly. Slow pace.
@@ -13,19 +15,36 @@ EMPATHETIC TTS RESPONSE RULES:
 - NEUTRAL/CONFUSED: Speak supportive and clarifying.
 """
 
+import abc
+import atexit
+import asyncio
+import contextlib
+import functools
+import hashlib
+import io
+import itertools
+import math
 import os
+import re
 import tempfile
+import threading
 import time
-import uuid
-from typing import Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterator, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 from loguru import logger
 from pathlib import Path
 
 from configs.config import config
 
+if TYPE_CHECKING:
+    # numpy is imported lazily at runtime; only annotations need it here
+    import numpy as np
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class VoiceSettings:
     """Voice synthesis settings for emotion-aware TTS."""
     speed: float
@@ -34,106 +53,256 @@ class VoiceSettings:
     tone_description: str
 
 
-class EmotionAwareTTS:
+# Emotion-specific voice settings, built once and shared read-only
+_EMOTION_VOICE_SETTINGS: Mapping[str, VoiceSettings] = MappingProxyType({
+    # SAD - Soft, warm, slow, comforting
+    "sad": VoiceSettings(
+        speed=0.80,
+        pitch=0.95,
+        warmth="very_high",
+        tone_description="soft, gentle, reassuring, slow pace"
+    ),
+    "sadness": VoiceSettings(
+        speed=0.80,
+        pitch=0.95,
+        warmth="very_high",
+        tone_description="soft, gentle, reassuring, slow pace"
+    ),
+    
+    # ANGRY - Calm, grounding, steady
+    "angry": VoiceSettings(
+        speed=0.88,
+        pitch=1.0,
+        warmth="high",
+        tone_description="calm, grounding, steady"
+    ),
+    "anger": VoiceSettings(
+        speed=0.88,
+        pitch=1.0,
+        warmth="high",
+        tone_description="calm, grounding, steady"
+    ),
+    
+    # HAPPY - Warm, positive
+    "happy": VoiceSettings(
+        speed=0.95,
+        pitch=1.02,
+        warmth="medium",
+        tone_description="warm, positive, encouraging"
+    ),
+    "joy": VoiceSettings(
+        speed=0.95,
+        pitch=1.02,
+        warmth="medium",
+        tone_description="warm, positive, encouraging"
+    ),
+    
+    # NEUTRAL - Supportive, clear
+    "neutral": VoiceSettings(
+        speed=0.92,
+        pitch=1.0,
+        warmth="medium",
+        tone_description="supportive, clarifying, balanced"
+    ),
+    
+    # FEAR/ANXIETY
+    "fear": VoiceSettings(
+        speed=0.82,
+        pitch=0.95,
+        warmth="very_high",
+        tone_description="very gentle, protective, warm"
+    ),
+    "anxiety": VoiceSettings(
+        speed=0.85,
+        pitch=0.98,
+        warmth="very_high",
+        tone_description="reassuring, gentle, steady"
+    ),
+})
+_NEUTRAL_SETTINGS = _EMOTION_VOICE_SETTINGS["neutral"]
+
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Coqui streaming: overlap between sentences and yielded block size (samples)
+_CROSSFADE_SAMPLES = 256
+_STREAM_BLOCK_SAMPLES = 1024
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text after sentence-ending punctuation."""
+    return [sentence for sentence in _SENTENCE_SPLIT_RE.split(text.strip()) if sentence]
+
+
+@functools.lru_cache(maxsize=16)
+def _warmth_filter(sr: int, warmth_level: str) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
+    """
+    Warmth low-pass, designed once per (sr, level).
+    
+    Returns the second-order sections and their unit-step initial
+    state (scale by the first sample before filtering), or None when
+    the cutoff is at or above Nyquist (nothing to filter).
+    """
+    from scipy.signal import butter, sosfilt_zi
+    
+    # Low-pass filter for warmth
+    if warmth_level == "very_high":
+        cutoff = 5500
+    else:
+        cutoff = 7000
+    
+    nyquist = sr / 2
+    if cutoff >= nyquist:
+        return None
+    sos = butter(2, cutoff / nyquist, btype='low', output='sos')
+    return sos, sosfilt_zi(sos)
+
+
+@functools.lru_cache(maxsize=16)
+def _resample_fir(up: int, down: int) -> "np.ndarray":
+    """Anti-aliasing FIR for resample_poly, designed once per (up, down)."""
+    from scipy.signal import firwin
+    
+    # Same design resample_poly uses by default
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    return firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+
+
+def _read_mono_float32(source) -> Tuple["np.ndarray", int]:
+    """
+    Read audio (path or file object) as mono float32 samples.
+    
+    Uses libsndfile directly. MP3 needs libsndfile >= 1.1, so older
+    builds fall back to pydub (ffmpeg).
+    """
+    import numpy as np
+    import soundfile as sf
+    
+    try:
+        y, sr = sf.read(source, dtype='float32', always_2d=False)
+    except RuntimeError:
+        from pydub import AudioSegment
+        
+        if hasattr(source, "seek"):
+            source.seek(0)
+        segment = AudioSegment.from_file(source)
+        y = np.array(segment.get_array_of_samples(), dtype=np.float32)
+        y /= float(1 << (8 * segment.sample_width - 1))
+        if segment.channels > 1:
+            y = y.reshape(-1, segment.channels)
+        sr = segment.frame_rate
+    
+    if y.ndim > 1:
+        y = y.mean(axis=1, dtype=np.float32)
+    return y, sr
+
+
+class _BaseTTS(abc.ABC):
+    """Interface shared by the real and mock TTS engines."""
+    
+    __slots__ = ()
+    
+    @abc.abstractmethod
+    def synthesize(
+        self,
+        text: str,
+        emotion: str = "neutral",
+        output_path: Optional[str] = None
+    ) -> Optional[str]:
+        """Synthesize speech, returning the audio file path or None."""
+    
+    @abc.abstractmethod
+    async def synthesize_async(self, text: str, emotion: str = "neutral") -> Optional[str]:
+        """Synthesize speech without blocking the event loop."""
+    
+    @abc.abstractmethod
+    def get_voice_settings(self, emotion: str) -> VoiceSettings:
+        """Get voice settings for emotion."""
+
+
+class EmotionAwareTTS(_BaseTTS):
     """
     Text-to-Speech with emotion-aware voice modulation.
     
-    FIXED: Now generates unique files every time (no caching issues)
+    FIXED: Each request gets its own output file. Repeated
+    (text, emotion) requests are served from an in-memory LRU of
+    synthesized audio, copied to the new file.
     """
     
+    __slots__ = (
+        "tts",
+        "tts_engine",
+        "_gtts_cls",
+        "model_name",
+        "_cache",
+        "_cache_lock",
+        "output_dir",
+        "_limit_loop",
+        "_limit",
+        "_coqui_on_cuda",
+        "emotion_voice_settings",
+    )
+    
+    # Synthesized payloads kept in memory, keyed by (text hash, emotion)
+    CACHE_SIZE = 128
+    
+    # synthesize_async() gTTS requests allowed in flight at once per
+    # event loop (Coqui runs one)
+    ASYNC_MAX_CONCURRENCY = 16
+    
+    # Shared pool for per-sentence gTTS requests, capped at 4 to
+    # stay clear of Google's rate limiting
+    GTTS_MAX_WORKERS = 4
+    _gtts_executor: Optional[ThreadPoolExecutor] = None
+    _gtts_executor_lock = threading.Lock()
+    
     def __init__(self):
         self.tts = None
         self.tts_engine = None
+        self._gtts_cls = None
+        self._coqui_on_cuda = False
         self.model_name = config.tts.model_name
         
+        self._cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         # Create a dedicated TTS output directory
         self.output_dir = Path(tempfile.gettempdir()) / "emovoice_tts"
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Clean old files on startup
-        self._cleanup_old_files()
-        
-        # Emotion-specific voice settings
-        self.emotion_voice_settings = {
-            # SAD - Soft, warm, slow, comforting
-            "sad": VoiceSettings(
-                speed=0.80,
-                pitch=0.95,
-                warmth="very_high",
-                tone_description="soft, gentle, reassuring, slow pace"
-            ),
-            "sadness": VoiceSettings(
-                speed=0.80,
-                pitch=0.95,
-                warmth="very_high",
-                tone_description="soft, gentle, reassuring, slow pace"
-            ),
-            
-            # ANGRY - Calm, grounding, steady
-            "angry": VoiceSettings(
-                speed=0.88,
-                pitch=1.0,
-                warmth="high",
-                tone_description="calm, grounding, steady"
-            ),
-            "anger": VoiceSettings(
-                speed=0.88,
-                pitch=1.0,
-                warmth="high",
-                tone_description="calm, grounding, steady"
-            ),
-            
-            # HAPPY - Warm, positive
-            "happy": VoiceSettings(
-                speed=0.95,
-                pitch=1.02,
-                warmth="medium",
-                tone_description="warm, positive, encouraging"
-            ),
-            "joy": VoiceSettings(
-                speed=0.95,
-                pitch=1.02,
-                warmth="medium",
-                tone_description="warm, positive, encouraging"
-            ),
-            
-            # NEUTRAL - Supportive, clear
-            "neutral": VoiceSettings(
-                speed=0.92,
-                pitch=1.0,
-                warmth="medium",
-                tone_description="supportive, clarifying, balanced"
-            ),
-            
-            # FEAR/ANXIETY
-            "fear": VoiceSettings(
-                speed=0.82,
-                pitch=0.95,
-                warmth="very_high",
-                tone_description="very gentle, protective, warm"
-            ),
-            "anxiety": VoiceSettings(
-                speed=0.85,
-                pitch=0.98,
-                warmth="very_high",
-                tone_description="reassuring, gentle, steady"
-            ),
-        }
+        # Clean old files in the background so startup isn't blocked,
+        # and once more at shutdown
+        threading.Thread(target=self._cleanup_old_files, daemon=True).start()
+        atexit.register(self._cleanup_old_files)
+        
+        # Concurrency limit for synthesize_async, bound to one event loop
+        self._limit_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._limit: Optional[asyncio.Semaphore] = None
+        
+        # Emotion-specific voice settings (shared, read-only)
+        self.emotion_voice_settings = _EMOTION_VOICE_SETTINGS
         
         self._init_tts()
     
     def _cleanup_old_files(self, max_age_seconds: int = 3600):
         """Clean up TTS files older than max_age_seconds."""
         try:
-            current_time = time.time()
-            for file_path in self.output_dir.glob("tts_*.mp3"):
-                if current_time - file_path.stat().st_mtime > max_age_seconds:
-                    file_path.unlink()
-                    logger.debug(f"Cleaned up old TTS file: {file_path}")
-            for file_path in self.output_dir.glob("tts_*.wav"):
-                if current_time - file_path.stat().st_mtime > max_age_seconds:
-                    file_path.unlink()
-                    logger.debug(f"Cleaned up old TTS file: {file_path}")
+            cutoff = time.time() - max_age_seconds
+            # One directory pass; DirEntry avoids a Path object per file
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.startswith("tts_"):
+                        continue
+                    if not (name.endswith(".mp3") or name.endswith(".wav")):
+                        continue
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                            logger.debug(f"Cleaned up old TTS file: {entry.path}")
+                    except FileNotFoundError:
+                        pass
         except Exception as e:
             logger.warning(f"Cleanup error: {e}")
     
@@ -142,6 +311,7 @@ class EmotionAwareTTS:
         # Try gTTS first (most reliable)
         try:
             from gtts import gTTS
+            self._gtts_cls = gTTS
             self.tts = "gtts"
             self.tts_engine = "gtts"
             logger.info("✅ gTTS initialized as TTS engine")
@@ -153,6 +323,7 @@ class EmotionAwareTTS:
         try:
             from TTS.api import TTS
             self.tts = TTS(self.model_name)
+            self._place_coqui_model()
             self.tts_engine = "coqui"
             logger.info(f"✅ Coqui TTS initialized: {self.model_name}")
             return
@@ -163,13 +334,40 @@ class EmotionAwareTTS:
         self.tts_engine = None
         logger.warning("⚠️ No TTS engine available")
     
+    def _place_coqui_model(self):
+        """Move the Coqui model to GPU when one is available and requested."""
+        import torch
+        
+        device = config.tts.device
+        if device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        
+        if device != "cuda":
+            logger.info("   Coqui TTS on CPU")
+            return
+        
+        try:
+            self.tts.to("cuda")
+        except Exception as e:
+            logger.warning(f"Could not move Coqui TTS to CUDA, staying on CPU: {e}")
+            # A failed move can leave some submodules on the GPU
+            self.tts.to("cpu")
+            return
+        
+        self._coqui_on_cuda = True
+        logger.info("   Coqui TTS on CUDA (FP16 autocast)")
+    
+    def _coqui_inference(self):
+        """Context for Coqui inference: FP16 autocast on CUDA, else a no-op."""
+        if not self._coqui_on_cuda:
+            return contextlib.nullcontext()
+        
+        import torch
+        return torch.autocast("cuda", dtype=torch.float16)
+    
     def get_voice_settings(self, emotion: str) -> VoiceSettings:
         """Get voice settings for emotion."""
-        emotion_lower = emotion.lower()
-        return self.emotion_voice_settings.get(
-            emotion_lower,
-            self.emotion_voice_settings["neutral"]
-        )
+        return _EMOTION_VOICE_SETTINGS.get(emotion.lower(), _NEUTRAL_SETTINGS)
     
     def synthesize(
         self,
@@ -180,7 +378,8 @@ class EmotionAwareTTS:
         """
         Synthesize speech with emotion-appropriate voice.
         
-        FIXED: Always generates a NEW unique file (no caching)
+        FIXED: Always writes a NEW unique file, even when the audio
+        comes from the in-memory cache
         
         Args:
             text: Text to speak
@@ -203,119 +402,344 @@ class EmotionAwareTTS:
         
         # ============================================
         # FIXED: Always generate UNIQUE filename
-        # Using timestamp + UUID to ensure no caching
+        # Using 8 random bytes so no path is ever reused
         # ============================================
-        timestamp = int(time.time() * 1000)  # Milliseconds
-        unique_id = uuid.uuid4().hex[:8]
-        
         if self.tts_engine == "gtts":
             suffix = ".mp3"
         else:
             suffix = ".wav"
         
-        filename = f"tts_{emotion}_{timestamp}_{unique_id}{suffix}"
-        output_path = str(self.output_dir / filename)
+        stem = f"tts_{emotion}_{os.urandom(8).hex()}"
         
-        logger.info(f"🔊 Generating TTS: {filename}")
-        logger.info(f"   Emotion: {emotion}")
-        logger.info(f"   Style: {settings.tone_description}")
+        # Repeated responses: write the cached audio to the new unique file
+        cache_key = (
+            hashlib.blake2b(text.encode(), digest_size=16).hexdigest(),
+            emotion.lower()
+        )
+        cached = self._cache_get(cache_key)
         
         try:
+            if cached is not None:
+                payload, suffix = cached
+                output_path = str(self.output_dir / f"{stem}{suffix}")
+                Path(output_path).write_bytes(payload)
+                logger.opt(lazy=True).info("✅ TTS cache hit: {}", lambda: output_path)
+                return output_path
+            
+            filename = f"{stem}{suffix}"
+            output_path = str(self.output_dir / filename)
+            
+            # Formatted only if INFO is enabled
+            logger.opt(lazy=True).info(
+                "🔊 Generating TTS: {} (emotion={}, style={})",
+                lambda: filename, lambda: emotion, lambda: settings.tone_description
+            )
+            
             if self.tts_engine == "gtts":
-                return self._synthesize_gtts(text, settings, output_path)
+                result = self._synthesize_gtts(text, settings, output_path)
             elif self.tts_engine == "coqui":
-                return self._synthesize_coqui(text, settings, output_path)
+                result = self._synthesize_coqui(text, settings, output_path)
             else:
                 return None
+            
+            if result is None:
+                return None
+            
+            # Cache the bytes just written rather than reading the file back
+            output_path, payload = result
+            self._cache_put(cache_key, (payload, Path(output_path).suffix))
+            return output_path
                 
-        except Exception as e:
-            logger.error(f"TTS synthesis failed: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("TTS synthesis failed")
             return None
     
+    def _cache_get(self, key: tuple) -> Optional[tuple]:
+        """Return cached (payload, suffix) and mark it recently used."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+            return entry
+    
+    def _cache_put(self, key: tuple, entry: tuple):
+        """Store (payload, suffix), evicting the least recently used."""
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Drop all cached synthesis results."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    async def synthesize_async(self, text: str, emotion: str = "neutral") -> Optional[str]:
+        """
+        Synthesize speech without blocking the event loop.
+        
+        synthesize() runs in a worker thread. gTTS requests are
+        network-bound and run concurrently up to ASYNC_MAX_CONCURRENCY;
+        a local Coqui model serves one request at a time.
+        
+        Args:
+            text: Text to speak
+            emotion: Detected emotion for voice styling
+            
+        Returns:
+            Path to generated audio file, or None if failed
+        """
+        loop = asyncio.get_running_loop()
+        if self._limit_loop is not loop:
+            self._limit_loop = loop
+            self._limit = asyncio.Semaphore(
+                1 if self.tts_engine == "coqui" else self.ASYNC_MAX_CONCURRENCY
+            )
+        
+        async with self._limit:
+            return await asyncio.to_thread(self.synthesize, text, emotion)
+    
+    def synthesize_stream(self, text: str, emotion: str = "neutral") -> Iterator[bytes]:
+        """
+        Stream synthesized audio as it is produced.
+        
+        With gTTS, MP3 chunks are yielded as they arrive from the network,
+        so playback can start before synthesis finishes. With Coqui, each
+        sentence is rendered in turn and emitted as raw PCM blocks. Warmth
+        processing needs the whole clip and is not applied on this path.
+        
+        Args:
+            text: Text to speak
+            emotion: Detected emotion for voice styling
+            
+        Yields:
+            Audio bytes (MP3 chunks for gTTS, mono float32 PCM at the
+            model's output sample rate for Coqui)
+        """
+        if not self.tts or not text or not text.strip():
+            return
+        
+        settings = self.get_voice_settings(emotion)
+        if self.tts_engine == "gtts":
+            yield from self._gtts_stream(text, settings)
+        else:
+            for block in self._synthesize_coqui_stream(text, settings):
+                yield block.tobytes()
+    
+    @classmethod
+    def _get_gtts_executor(cls) -> ThreadPoolExecutor:
+        """Create the shared gTTS thread pool on first use."""
+        with cls._gtts_executor_lock:
+            if cls._gtts_executor is None:
+                cls._gtts_executor = ThreadPoolExecutor(
+                    max_workers=cls.GTTS_MAX_WORKERS,
+                    thread_name_prefix="gtts"
+                )
+            return cls._gtts_executor
+    
+    def _gtts_stream(self, text: str, settings: VoiceSettings) -> Iterator[bytes]:
+        """Yield MP3 chunks from Google TTS as they are downloaded."""
+        # Slow parameter based on speed setting
+        slow = settings.speed < 0.9
+        
+        sentences = _split_sentences(text)
+        if len(sentences) <= 1:
+            tts = self._gtts_cls(text=text, lang='en', slow=slow)
+            return tts.stream()
+        
+        # MP3 frames concatenate cleanly, so sentences are fetched
+        # concurrently and yielded in order as each one completes
+        return self._get_gtts_executor().map(
+            self._fetch_gtts, sentences, itertools.repeat(slow)
+        )
+    
+    def _fetch_gtts(self, text: str, slow: bool) -> bytes:
+        """Fetch the complete MP3 for one piece of text."""
+        buf = io.BytesIO()
+        self._gtts_cls(text=text, lang='en', slow=slow).write_to_fp(buf)
+        return buf.getvalue()
+    
     def _synthesize_gtts(
         self,
         text: str,
         settings: VoiceSettings,
         output_path: str
-    ) -> Optional[str]:
-        """Synthesize using Google TTS."""
-        from gtts import gTTS
-        
-        # Slow parameter based on speed setting
-        slow = settings.speed < 0.9
+    ) -> Optional[Tuple[str, bytes]]:
+        """Synthesize using Google TTS, returning the path and its bytes."""
+        if settings.warmth != "very_high":
+            # Write chunks as they arrive instead of buffering the whole MP3
+            chunks = []
+            with open(output_path, "wb") as f:
+                for chunk in self._gtts_stream(text, settings):
+                    f.write(chunk)
+                    chunks.append(chunk)
+            
+            logger.info(f"✅ TTS saved: {output_path}")
+            return output_path, b"".join(chunks)
         
-        tts = gTTS(text=text, lang='en', slow=slow)
-        tts.save(output_path)
+        # Warmth needs the whole clip: keep the MP3 in memory and filter
+        # it there instead of writing, re-reading and rewriting the file
+        buf = io.BytesIO()
+        for chunk in self._gtts_stream(text, settings):
+            buf.write(chunk)
+        buf.seek(0)
         
-        # Apply warmth processing if needed
-        if settings.warmth in ["high", "very_high"]:
-            output_path = self._apply_warmth(output_path, settings.warmth)
+        payload = self._apply_warmth_buf(buf, settings.warmth)
+        if payload is not None:
+            # Filtered audio is PCM, so it is written as a real .wav
+            output_path = str(Path(output_path).with_suffix(".wav"))
+        else:
+            payload = buf.getvalue()
+        Path(output_path).write_bytes(payload)
         
         logger.info(f"✅ TTS saved: {output_path}")
-        return output_path
+        return output_path, payload
     
     def _synthesize_coqui(
         self,
         text: str,
         settings: VoiceSettings,
         output_path: str
-    ) -> Optional[str]:
-        """Synthesize using Coqui TTS."""
-        self.tts.tts_to_file(
-            text=text,
-            file_path=output_path,
-            speed=settings.speed
-        )
+    ) -> Optional[Tuple[str, bytes]]:
+        """Synthesize using Coqui TTS, returning the path and its bytes."""
+        with self._coqui_inference():
+            wav = self.tts.tts(text=text, speed=settings.speed)
         
-        # Apply warmth processing if needed
-        if settings.warmth in ["high", "very_high"]:
-            output_path = self._apply_warmth(output_path, settings.warmth)
+        # The same WAV writer tts_to_file() uses, pointed at memory
+        buf = io.BytesIO()
+        self.tts.synthesizer.save_wav(wav=wav, path=buf)
+        
+        # Apply warmth processing if needed ("high" is near-inaudible at 7 kHz)
+        payload = None
+        if settings.warmth == "very_high":
+            buf.seek(0)
+            payload = self._apply_warmth_buf(buf, settings.warmth)
+        if payload is None:
+            payload = buf.getvalue()
+        Path(output_path).write_bytes(payload)
         
         logger.info(f"✅ TTS saved: {output_path}")
-        return output_path
+        return output_path, payload
     
-    def _apply_warmth(self, audio_path: str, warmth_level: str) -> str:
-        """Apply warmth processing to soften the voice."""
-        try:
-            import librosa
-            import soundfile as sf
-            import numpy as np
-            from scipy.signal import butter, filtfilt
+    def _synthesize_coqui_stream(
+        self,
+        text: str,
+        settings: VoiceSettings
+    ) -> Iterator["np.ndarray"]:
+        """
+        Yield float32 sample blocks from Coqui, one sentence at a time.
+        
+        Consecutive sentences overlap by a short linear crossfade so the
+        joins don't click. First audio is ready after the first sentence
+        rather than after the whole text.
+        """
+        import numpy as np
+        
+        fade_in = np.linspace(0.0, 1.0, _CROSSFADE_SAMPLES, dtype=np.float32)
+        tail = None
+        
+        for sentence in _split_sentences(text):
+            with self._coqui_inference():
+                wav = self.tts.tts(text=sentence, speed=settings.speed)
+            chunk = np.array(wav, dtype=np.float32)
             
-            y, sr = librosa.load(audio_path, sr=None)
+            if tail is not None:
+                if chunk.size >= _CROSSFADE_SAMPLES:
+                    head = chunk[:_CROSSFADE_SAMPLES]
+                    head *= fade_in
+                    head += tail * fade_in[::-1]
+                else:
+                    chunk = np.concatenate((tail, chunk))
             
-            # Low-pass filter for warmth
-            if warmth_level == "very_high":
-                cutoff = 5500
+            if chunk.size > _CROSSFADE_SAMPLES:
+                body, tail = chunk[:-_CROSSFADE_SAMPLES], chunk[-_CROSSFADE_SAMPLES:]
             else:
-                cutoff = 7000
-            
-            nyquist = sr / 2
-            normalized_cutoff = cutoff / nyquist
-            b, a = butter(2, normalized_cutoff, btype='low')
-            y_warm = filtfilt(b, a, y)
+                body, tail = chunk, None
             
-            # Normalize
-            y_warm = y_warm / np.max(np.abs(y_warm)) * 0.95
+            for start in range(0, body.size, _STREAM_BLOCK_SAMPLES):
+                yield body[start:start + _STREAM_BLOCK_SAMPLES]
+        
+        if tail is not None:
+            yield tail
+    
+    def _apply_warmth_buf(
+        self,
+        buf: io.BytesIO,
+        warmth_level: str,
+        target_sr: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Apply warmth processing to in-memory audio, returning WAV bytes."""
+        try:
+            import soundfile as sf
             
-            sf.write(audio_path, y_warm, sr)
+            y, sr = _read_mono_float32(buf)
+            y_warm, sr = self._warm_samples(y, sr, warmth_level, target_sr)
+            out = io.BytesIO()
+            sf.write(out, y_warm, sr, format='WAV')
             
-            return audio_path
+            return out.getvalue()
             
         except Exception as e:
             logger.warning(f"Warmth processing failed: {e}")
-            return audio_path
+            return None
+    
+    def _warm_samples(
+        self,
+        y: "np.ndarray",
+        sr: int,
+        warmth_level: str,
+        target_sr: Optional[int] = None
+    ) -> Tuple["np.ndarray", int]:
+        """
+        Low-pass and peak-normalize samples to soften the voice.
+        
+        Audio keeps its native rate unless target_sr is given (e.g. 8000
+        for telephony), in which case it is downsampled first. Returns
+        the processed samples and their sample rate.
+        """
+        import numpy as np
+        from scipy.signal import resample_poly, sosfilt
+        
+        sr = int(sr)
+        if target_sr is not None and sr > target_sr:
+            g = math.gcd(target_sr, sr)
+            up, down = target_sr // g, sr // g
+            y = resample_poly(y, up, down, window=_resample_fir(up, down))
+            sr = target_sr
+        
+        y_warm = y
+        warmth_filter = _warmth_filter(sr, warmth_level)
+        # At 8 kHz the cutoff sits above Nyquist; resampling already band-limited it
+        if warmth_filter is not None and y.size:
+            # Zero-phase: forward pass, then the same filter over the
+            # reversed signal, each started from a steady state
+            sos, zi = warmth_filter
+            y_fwd, _ = sosfilt(sos, y, zi=zi * y[0])
+            y_rev, _ = sosfilt(sos, y_fwd[::-1], zi=zi * y_fwd[-1])
+            y_warm = y_rev[::-1]
+        y_warm = np.ascontiguousarray(y_warm, dtype=np.float32)
+        
+        # Normalize in place to 0.95 peak
+        peak = np.abs(y_warm).max()
+        if peak > 0:
+            np.multiply(y_warm, 0.95 / peak, out=y_warm)
+        
+        return y_warm, sr
 
 
-class MockTTS:
+class MockTTS(_BaseTTS):
     """Mock TTS for testing."""
     
+    __slots__ = ()
+    
     def synthesize(self, text: str, emotion: str = "neutral", output_path: Optional[str] = None) -> Optional[str]:
         logger.info(f"[MOCK TTS] {emotion}: '{text[:50]}...'")
         return None
     
+    async def synthesize_async(self, text: str, emotion: str = "neutral") -> Optional[str]:
+        return self.synthesize(text, emotion)
+    
     def get_voice_settings(self, emotion: str) -> VoiceSettings:
         return VoiceSettings(speed=0.92, pitch=1.0, warmth="medium", tone_description="mock")
 
@@ -329,5 +753,16 @@ def get_tts():
     return tts_instance
 
 
-# Singleton instance
-emotion_tts = get_tts()
\ No newline at end of file
+# Singleton instance (created on first use)
+@functools.cache
+def _default_tts():
+    """Shared TTS engine, created on first use instead of at import."""
+    return get_tts()
+
+
+def __getattr__(name):
+    # `emotion_tts` stays importable without probing engines or loading
+    # a Coqui model at import time
+    if name == "emotion_tts":
+        return _default_tts()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -5,14 +5,18 @@ Maps emotions to appropriate wellness modules and suggestions
 UPDATED: Added get_all_suggestions() method to return 4 wellness cards per emotion
 """
 
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+import functools
+from types import MappingProxyType
+from typing import Mapping, Sequence
+from dataclasses import dataclass, field
 from enum import Enum
-import random
-from loguru import logger
 
 from configs.config import config
-from modules.emotion_fusion import FusedEmotionResult
+from modules.emotion_fusion import FusedEmotionResult, Intensity
+
+
+# Intensity levels produced by EmotionFusion
+INTENSITY_LEVELS = tuple(level.name.lower() for level in Intensity)
 
 
 class WellnessModule(Enum):
@@ -34,443 +38,498 @@ class WellnessModule(Enum):
     GENERAL = "general_wellness"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WellnessSuggestion:
-    """Container for a wellness suggestion."""
+    """Container for a wellness suggestion (immutable, hashable)."""
     module: WellnessModule
     title: str
     description: str
     duration: str
-    instructions: List[str]
+    instructions: tuple[str, ...]
     tone: str  # soft, calm, reassuring, gentle
-
-
-class WellnessEngine:
-    """
-    Maps detected emotions to appropriate wellness activities.
     
-    Core principle: Suggest ONE small, achievable activity
-    Never overwhelming, always optional
-    
-    UPDATED: Now supports get_all_suggestions() for 4 wellness cards
-    """
-    
-    def __init__(self):
-        # Emotion to module mapping from config
-        self.emotion_modules = config.emotion.emotion_modules
-        
-        # Detailed wellness activities
-        self.activities = self._initialize_activities()
-        
-        # Extended emotion-specific activity lists
-        # Uses emotion names from prosody detector: anger, happy, sad, neutral
-        self.emotion_activity_map = {
-            # SAD emotion - 4+ activities
-            "sad": [
-                "guided_meditation", 
-                "self_compassion", 
-                "positive_affirmation", 
-                "nature_visualization", 
-                "journaling", 
-                "emotional_release",
-                "color_breathing"
-            ],
-            "sadness": [
-                "guided_meditation", 
-                "self_compassion", 
-                "positive_affirmation", 
-                "nature_visualization", 
-                "journaling", 
-                "emotional_release",
-                "color_breathing"
-            ],
-            
-            # ANGRY emotion - 4+ activities
-            "anger": [
-                "breathing", 
-                "box_breathing", 
-                "cold_water_reset", 
-                "grounding", 
-                "movement_break", 
-                "yoga",
-                "body_scan"
-            ],
-            "angry": [
-                "breathing", 
-                "box_breathing", 
-                "cold_water_reset", 
-                "grounding", 
-                "movement_break", 
-                "yoga",
-                "body_scan"
-            ],
-            
-            # HAPPY emotion - 4+ activities
-            "happy": [
-                "gratitude", 
-                "mindfulness", 
-                "reflection", 
-                "nature_visualization", 
-                "journaling", 
-                "yoga"
-            ],
-            "joy": [
-                "gratitude", 
-                "mindfulness", 
-                "reflection", 
-                "nature_visualization", 
-                "journaling", 
-                "yoga"
-            ],
-            
-            # NEUTRAL emotion - 4+ activities
-            "neutral": [
-                "general_wellness", 
-                "reflection", 
-                "mindfulness", 
-                "gratitude", 
-                "breathing", 
-                "nature_visualization"
-            ],
-            
-            # FEAR/ANXIETY - 4+ activities
-            "fear": [
-                "safety_grounding",
-                "reassurance",
-                "breathing",
-                "grounding",
-                "calming_exercises",
-                "body_scan"
-            ],
-            "anxiety": [
-                "box_breathing",
-                "grounding",
-                "reassurance",
-                "safety_grounding",
-                "mindfulness",
-                "body_scan"
-            ],
-        }
+    # Derived once for get_suggestion_text
+    title_lower: str = field(init=False, repr=False, compare=False)
+    first_instruction_lower: str = field(init=False, repr=False, compare=False)
     
-    def _initialize_activities(self) -> Dict[str, WellnessSuggestion]:
-        """Initialize all wellness activity definitions."""
-        return {
-            "breathing": WellnessSuggestion(
-                module=WellnessModule.BREATHING,
-                title="Gentle Breathing",
-                description="A simple breathing exercise to help you feel more grounded.",
-                duration="2-3 minutes",
-                instructions=[
-                    "Find a comfortable position",
-                    "Breathe in slowly through your nose for 4 counts",
-                    "Hold gently for 4 counts",
-                    "Exhale slowly through your mouth for 6 counts",
-                    "Repeat 3-4 times, or as long as feels comfortable"
-                ],
-                tone="soft"
+    def __post_init__(self):
+        # Frozen: derived fields are set through object.__setattr__
+        object.__setattr__(self, "title_lower", self.title.lower())
+        object.__setattr__(
+            self,
+            "first_instruction_lower",
+            self.instructions[0].lower() if self.instructions else ""
+        )
+
+
+# Calming activities put first for high intensity, in order
+_CALMING_PRIORITY_ACTIVITIES = (
+    "breathing", "box_breathing", "grounding",
+    "safety_grounding", "reassurance", "cold_water_reset",
+)
+
+# General activities used to fill remaining suggestion slots
+_GENERAL_FALLBACK_ACTIVITIES = ("breathing", "mindfulness", "grounding", "gratitude")
+
+# Modules preferred by get_suggestion for high intensity, in order
+_PRIORITY_MODULES = ("breathing", "grounding", "safety_grounding", "reassurance")
+
+# Emotion-specific activity lists (4+ activities each)
+
+# SAD emotion
+_SAD_ACTIVITIES = (
+    "guided_meditation",
+    "self_compassion",
+    "positive_affirmation",
+    "nature_visualization",
+    "journaling",
+    "emotional_release",
+    "color_breathing",
+)
+
+# ANGRY emotion
+_ANGER_ACTIVITIES = (
+    "breathing",
+    "box_breathing",
+    "cold_water_reset",
+    "grounding",
+    "movement_break",
+    "yoga",
+    "body_scan",
+)
+
+# HAPPY emotion
+_HAPPY_ACTIVITIES = (
+    "gratitude",
+    "mindfulness",
+    "reflection",
+    "nature_visualization",
+    "journaling",
+    "yoga",
+)
+
+# NEUTRAL emotion
+_NEUTRAL_ACTIVITIES = (
+    "general_wellness",
+    "reflection",
+    "mindfulness",
+    "gratitude",
+    "breathing",
+    "nature_visualization",
+)
+
+# FEAR/ANXIETY
+_FEAR_ACTIVITIES = (
+    "safety_grounding",
+    "reassurance",
+    "breathing",
+    "grounding",
+    "calming_exercises",
+    "body_scan",
+)
+_ANXIETY_ACTIVITIES = (
+    "box_breathing",
+    "grounding",
+    "reassurance",
+    "safety_grounding",
+    "mindfulness",
+    "body_scan",
+)
+
+
+def _build_activities() -> dict[str, WellnessSuggestion]:
+    """Build all wellness activity definitions."""
+    return {
+        "breathing": WellnessSuggestion(
+            module=WellnessModule.BREATHING,
+            title="Gentle Breathing",
+            description="A simple breathing exercise to help you feel more grounded.",
+            duration="2-3 minutes",
+            instructions=(
+                "Find a comfortable position",
+                "Breathe in slowly through your nose for 4 counts",
+                "Hold gently for 4 counts",
+                "Exhale slowly through your mouth for 6 counts",
+                "Repeat 3-4 times, or as long as feels comfortable"
             ),
-            "box_breathing": WellnessSuggestion(
-                module=WellnessModule.BREATHING,
-                title="Box Breathing",
-                description="A calming technique used by Navy SEALs to reduce stress instantly.",
-                duration="3-4 minutes",
-                instructions=[
-                    "Breathe in for 4 seconds",
-                    "Hold for 4 seconds",
-                    "Breathe out for 4 seconds",
-                    "Hold for 4 seconds",
-                    "Repeat 4-6 times"
-                ],
-                tone="calm"
+            tone="soft"
+        ),
+        "box_breathing": WellnessSuggestion(
+            module=WellnessModule.BREATHING,
+            title="Box Breathing",
+            description="A calming technique used by Navy SEALs to reduce stress instantly.",
+            duration="3-4 minutes",
+            instructions=(
+                "Breathe in for 4 seconds",
+                "Hold for 4 seconds",
+                "Breathe out for 4 seconds",
+                "Hold for 4 seconds",
+                "Repeat 4-6 times"
             ),
-            "grounding": WellnessSuggestion(
-                module=WellnessModule.GROUNDING,
-                title="5-4-3-2-1 Grounding",
-                description="A grounding technique to bring you back to the present moment.",
-                duration="3-5 minutes",
-                instructions=[
-                    "Notice 5 things you can see around you",
-                    "Notice 4 things you can touch or feel",
-                    "Notice 3 things you can hear",
-                    "Notice 2 things you can smell",
-                    "Notice 1 thing you can taste",
-                    "Take a deep breath when you're done"
-                ],
-                tone="calm"
+            tone="calm"
+        ),
+        "grounding": WellnessSuggestion(
+            module=WellnessModule.GROUNDING,
+            title="5-4-3-2-1 Grounding",
+            description="A grounding technique to bring you back to the present moment.",
+            duration="3-5 minutes",
+            instructions=(
+                "Notice 5 things you can see around you",
+                "Notice 4 things you can touch or feel",
+                "Notice 3 things you can hear",
+                "Notice 2 things you can smell",
+                "Notice 1 thing you can taste",
+                "Take a deep breath when you're done"
             ),
-            "yoga": WellnessSuggestion(
-                module=WellnessModule.YOGA,
-                title="Gentle Stretching",
-                description="Simple stretches to release tension from your body.",
-                duration="5 minutes",
-                instructions=[
-                    "Stand or sit comfortably",
-                    "Gently roll your shoulders back",
-                    "Slowly turn your head side to side",
-                    "Reach your arms up and stretch",
-                    "Take slow, deep breaths as you move"
-                ],
-                tone="calm"
+            tone="calm"
+        ),
+        "yoga": WellnessSuggestion(
+            module=WellnessModule.YOGA,
+            title="Gentle Stretching",
+            description="Simple stretches to release tension from your body.",
+            duration="5 minutes",
+            instructions=(
+                "Stand or sit comfortably",
+                "Gently roll your shoulders back",
+                "Slowly turn your head side to side",
+                "Reach your arms up and stretch",
+                "Take slow, deep breaths as you move"
             ),
-            "guided_meditation": WellnessSuggestion(
-                module=WellnessModule.MEDITATION,
-                title="Brief Meditation",
-                description="A short moment of peaceful stillness.",
-                duration="3-5 minutes",
-                instructions=[
-                    "Find a quiet, comfortable spot",
-                    "Close your eyes if it feels okay",
-                    "Focus on your breath, without changing it",
-                    "When thoughts come, gently let them pass",
-                    "Return your attention to your breath"
-                ],
-                tone="soft"
+            tone="calm"
+        ),
+        "guided_meditation": WellnessSuggestion(
+            module=WellnessModule.MEDITATION,
+            title="Brief Meditation",
+            description="A short moment of peaceful stillness.",
+            duration="3-5 minutes",
+            instructions=(
+                "Find a quiet, comfortable spot",
+                "Close your eyes if it feels okay",
+                "Focus on your breath, without changing it",
+                "When thoughts come, gently let them pass",
+                "Return your attention to your breath"
             ),
-            "journaling": WellnessSuggestion(
-                module=WellnessModule.JOURNALING,
-                title="Quick Journal Prompt",
-                description="Writing can help process feelings.",
-                duration="5-10 minutes",
-                instructions=[
-                    "Find a piece of paper or open a note",
-                    "Write whatever comes to mind",
-                    "No need to organize or make it perfect",
-                    "Just let your thoughts flow onto the page",
-                    "You can keep it or let it go afterward"
-                ],
-                tone="gentle"
+            tone="soft"
+        ),
+        "journaling": WellnessSuggestion(
+            module=WellnessModule.JOURNALING,
+            title="Quick Journal Prompt",
+            description="Writing can help process feelings.",
+            duration="5-10 minutes",
+            instructions=(
+                "Find a piece of paper or open a note",
+                "Write whatever comes to mind",
+                "No need to organize or make it perfect",
+                "Just let your thoughts flow onto the page",
+                "You can keep it or let it go afterward"
             ),
-            "self_compassion": WellnessSuggestion(
-                module=WellnessModule.SELF_COMPASSION,
-                title="Self-Compassion Moment",
-                description="A gentle reminder to be kind to yourself.",
-                duration="2-3 minutes",
-                instructions=[
-                    "Place your hand on your heart",
-                    "Say to yourself: 'This is a difficult moment'",
-                    "Remember: difficulty is part of being human",
-                    "Say: 'May I be kind to myself'",
-                    "Take a few breaths and let that sink in"
-                ],
-                tone="soft"
+            tone="gentle"
+        ),
+        "self_compassion": WellnessSuggestion(
+            module=WellnessModule.SELF_COMPASSION,
+            title="Self-Compassion Moment",
+            description="A gentle reminder to be kind to yourself.",
+            duration="2-3 minutes",
+            instructions=(
+                "Place your hand on your heart",
+                "Say to yourself: 'This is a difficult moment'",
+                "Remember: difficulty is part of being human",
+                "Say: 'May I be kind to myself'",
+                "Take a few breaths and let that sink in"
             ),
-            "mindfulness": WellnessSuggestion(
-                module=WellnessModule.MINDFULNESS,
-                title="Mindful Moment",
-                description="A brief pause to be present.",
-                duration="1-2 minutes",
-                instructions=[
-                    "Pause whatever you're doing",
-                    "Take three slow, deep breaths",
-                    "Notice how your body feels right now",
-                    "Notice any thoughts without judgment",
-                    "Return to your breath"
-                ],
-                tone="calm"
+            tone="soft"
+        ),
+        "mindfulness": WellnessSuggestion(
+            module=WellnessModule.MINDFULNESS,
+            title="Mindful Moment",
+            description="A brief pause to be present.",
+            duration="1-2 minutes",
+            instructions=(
+                "Pause whatever you're doing",
+                "Take three slow, deep breaths",
+                "Notice how your body feels right now",
+                "Notice any thoughts without judgment",
+                "Return to your breath"
             ),
-            "body_scan": WellnessSuggestion(
-                module=WellnessModule.BODY_SCAN,
-                title="Quick Body Check",
-                description="Notice and release tension in your body.",
-                duration="3-5 minutes",
-                instructions=[
-                    "Start by noticing your feet",
-                    "Slowly move your attention up through your body",
-                    "Notice any areas of tension",
-                    "Breathe into those areas",
-                    "Let the tension soften with each exhale"
-                ],
-                tone="soft"
+            tone="calm"
+        ),
+        "body_scan": WellnessSuggestion(
+            module=WellnessModule.BODY_SCAN,
+            title="Quick Body Check",
+            description="Notice and release tension in your body.",
+            duration="3-5 minutes",
+            instructions=(
+                "Start by noticing your feet",
+                "Slowly move your attention up through your body",
+                "Notice any areas of tension",
+                "Breathe into those areas",
+                "Let the tension soften with each exhale"
             ),
-            "reassurance": WellnessSuggestion(
-                module=WellnessModule.REASSURANCE,
-                title="Grounding Affirmation",
-                description="Words of comfort for anxious moments.",
-                duration="1-2 minutes",
-                instructions=[
-                    "Find a comfortable position",
-                    "Say to yourself: 'I am safe in this moment'",
-                    "Say: 'This feeling will pass'",
-                    "Say: 'I can handle difficult things'",
-                    "Take a deep breath and feel your feet on the ground"
-                ],
-                tone="reassuring"
+            tone="soft"
+        ),
+        "reassurance": WellnessSuggestion(
+            module=WellnessModule.REASSURANCE,
+            title="Grounding Affirmation",
+            description="Words of comfort for anxious moments.",
+            duration="1-2 minutes",
+            instructions=(
+                "Find a comfortable position",
+                "Say to yourself: 'I am safe in this moment'",
+                "Say: 'This feeling will pass'",
+                "Say: 'I can handle difficult things'",
+                "Take a deep breath and feel your feet on the ground"
             ),
-            "safety_grounding": WellnessSuggestion(
-                module=WellnessModule.SAFETY_GROUNDING,
-                title="Safety Check",
-                description="Remind yourself you are safe right now.",
-                duration="1-2 minutes",
-                instructions=[
-                    "Look around and notice where you are",
-                    "Name 3 things that show you're safe",
-                    "Feel the chair/floor supporting you",
-                    "Say: 'Right now, in this moment, I am okay'",
-                    "Take a slow breath"
-                ],
-                tone="reassuring"
+            tone="reassuring"
+        ),
+        "safety_grounding": WellnessSuggestion(
+            module=WellnessModule.SAFETY_GROUNDING,
+            title="Safety Check",
+            description="Remind yourself you are safe right now.",
+            duration="1-2 minutes",
+            instructions=(
+                "Look around and notice where you are",
+                "Name 3 things that show you're safe",
+                "Feel the chair/floor supporting you",
+                "Say: 'Right now, in this moment, I am okay'",
+                "Take a slow breath"
             ),
-            "calming_exercises": WellnessSuggestion(
-                module=WellnessModule.CALMING,
-                title="Quick Calm",
-                description="Simple techniques to reduce stress quickly.",
-                duration="2-3 minutes",
-                instructions=[
-                    "Splash cold water on your face",
-                    "Or hold something cold in your hands",
-                    "Focus on the sensation",
-                    "Take slow breaths",
-                    "Notice how your body responds"
-                ],
-                tone="calm"
+            tone="reassuring"
+        ),
+        "calming_exercises": WellnessSuggestion(
+            module=WellnessModule.CALMING,
+            title="Quick Calm",
+            description="Simple techniques to reduce stress quickly.",
+            duration="2-3 minutes",
+            instructions=(
+                "Splash cold water on your face",
+                "Or hold something cold in your hands",
+                "Focus on the sensation",
+                "Take slow breaths",
+                "Notice how your body responds"
             ),
-            "reflection": WellnessSuggestion(
-                module=WellnessModule.REFLECTION,
-                title="Gentle Reflection",
-                description="Take a moment to check in with yourself.",
-                duration="3-5 minutes",
-                instructions=[
-                    "Ask yourself: 'How am I really feeling?'",
-                    "Don't judge the answer, just notice",
-                    "Ask: 'What do I need right now?'",
-                    "Consider one small thing you could do for yourself",
-                    "Give yourself permission to feel what you feel"
-                ],
-                tone="gentle"
+            tone="calm"
+        ),
+        "reflection": WellnessSuggestion(
+            module=WellnessModule.REFLECTION,
+            title="Gentle Reflection",
+            description="Take a moment to check in with yourself.",
+            duration="3-5 minutes",
+            instructions=(
+                "Ask yourself: 'How am I really feeling?'",
+                "Don't judge the answer, just notice",
+                "Ask: 'What do I need right now?'",
+                "Consider one small thing you could do for yourself",
+                "Give yourself permission to feel what you feel"
             ),
-            "gratitude": WellnessSuggestion(
-                module=WellnessModule.GRATITUDE,
-                title="Gratitude Moment",
-                description="Notice small things to appreciate.",
-                duration="2-3 minutes",
-                instructions=[
-                    "Think of one thing you're grateful for today",
-                    "It can be something very small",
-                    "Notice how it feels to appreciate it",
-                    "Think of one more thing",
-                    "Let the warmth of gratitude settle in"
-                ],
-                tone="gentle"
+            tone="gentle"
+        ),
+        "gratitude": WellnessSuggestion(
+            module=WellnessModule.GRATITUDE,
+            title="Gratitude Moment",
+            description="Notice small things to appreciate.",
+            duration="2-3 minutes",
+            instructions=(
+                "Think of one thing you're grateful for today",
+                "It can be something very small",
+                "Notice how it feels to appreciate it",
+                "Think of one more thing",
+                "Let the warmth of gratitude settle in"
             ),
-            "rest": WellnessSuggestion(
-                module=WellnessModule.REST,
-                title="Permission to Rest",
-                description="Sometimes rest is the most helpful thing.",
-                duration="5-15 minutes",
-                instructions=[
-                    "Find a comfortable place to sit or lie down",
-                    "Let your body relax completely",
-                    "Close your eyes if it feels good",
-                    "You don't need to do anything right now",
-                    "Just rest"
-                ],
-                tone="soft"
+            tone="gentle"
+        ),
+        "rest": WellnessSuggestion(
+            module=WellnessModule.REST,
+            title="Permission to Rest",
+            description="Sometimes rest is the most helpful thing.",
+            duration="5-15 minutes",
+            instructions=(
+                "Find a comfortable place to sit or lie down",
+                "Let your body relax completely",
+                "Close your eyes if it feels good",
+                "You don't need to do anything right now",
+                "Just rest"
             ),
-            "general_wellness": WellnessSuggestion(
-                module=WellnessModule.GENERAL,
-                title="Wellness Check-In",
-                description="A simple check-in with yourself.",
-                duration="2-3 minutes",
-                instructions=[
-                    "Pause and take a breath",
-                    "Notice how you're feeling physically",
-                    "Notice how you're feeling emotionally",
-                    "Ask what you might need right now",
-                    "Honor whatever comes up"
-                ],
-                tone="calm"
+            tone="soft"
+        ),
+        "general_wellness": WellnessSuggestion(
+            module=WellnessModule.GENERAL,
+            title="Wellness Check-In",
+            description="A simple check-in with yourself.",
+            duration="2-3 minutes",
+            instructions=(
+                "Pause and take a breath",
+                "Notice how you're feeling physically",
+                "Notice how you're feeling emotionally",
+                "Ask what you might need right now",
+                "Honor whatever comes up"
             ),
-            "positive_affirmation": WellnessSuggestion(
-                module=WellnessModule.SELF_COMPASSION,
-                title="Positive Affirmations",
-                description="Gentle words to lift your spirit.",
-                duration="2-3 minutes",
-                instructions=[
-                    "Place your hand on your heart",
-                    "Say: 'I am worthy of love and kindness'",
-                    "Say: 'I am doing the best I can'",
-                    "Say: 'I deserve peace and happiness'",
-                    "Breathe deeply and let these words sink in"
-                ],
-                tone="soft"
+            tone="calm"
+        ),
+        "positive_affirmation": WellnessSuggestion(
+            module=WellnessModule.SELF_COMPASSION,
+            title="Positive Affirmations",
+            description="Gentle words to lift your spirit.",
+            duration="2-3 minutes",
+            instructions=(
+                "Place your hand on your heart",
+                "Say: 'I am worthy of love and kindness'",
+                "Say: 'I am doing the best I can'",
+                "Say: 'I deserve peace and happiness'",
+                "Breathe deeply and let these words sink in"
             ),
-            "nature_visualization": WellnessSuggestion(
-                module=WellnessModule.MEDITATION,
-                title="Nature Visualization",
-                description="Mentally transport yourself to a peaceful natural setting.",
-                duration="3-5 minutes",
-                instructions=[
-                    "Close your eyes and imagine a peaceful forest",
-                    "Picture sunlight filtering through leaves",
-                    "Hear birds singing and water flowing",
-                    "Feel a gentle breeze on your skin",
-                    "Stay in this peaceful place as long as needed"
-                ],
-                tone="soft"
+            tone="soft"
+        ),
+        "nature_visualization": WellnessSuggestion(
+            module=WellnessModule.MEDITATION,
+            title="Nature Visualization",
+            description="Mentally transport yourself to a peaceful natural setting.",
+            duration="3-5 minutes",
+            instructions=(
+                "Close your eyes and imagine a peaceful forest",
+                "Picture sunlight filtering through leaves",
+                "Hear birds singing and water flowing",
+                "Feel a gentle breeze on your skin",
+                "Stay in this peaceful place as long as needed"
             ),
-            "cold_water_reset": WellnessSuggestion(
-                module=WellnessModule.CALMING,
-                title="Cold Water Reset",
-                description="Use cold water to quickly calm your nervous system.",
-                duration="1-2 minutes",
-                instructions=[
-                    "Go to a sink with cold water",
-                    "Splash cold water on your face",
-                    "Or hold ice cubes in your hands",
-                    "Focus on the cooling sensation",
-                    "Take slow, deep breaths"
-                ],
-                tone="calm"
+            tone="soft"
+        ),
+        "cold_water_reset": WellnessSuggestion(
+            module=WellnessModule.CALMING,
+            title="Cold Water Reset",
+            description="Use cold water to quickly calm your nervous system.",
+            duration="1-2 minutes",
+            instructions=(
+                "Go to a sink with cold water",
+                "Splash cold water on your face",
+                "Or hold ice cubes in your hands",
+                "Focus on the cooling sensation",
+                "Take slow, deep breaths"
             ),
-            "movement_break": WellnessSuggestion(
-                module=WellnessModule.YOGA,
-                title="Quick Movement Break",
-                description="Gentle movement to release stuck energy.",
-                duration="3-5 minutes",
-                instructions=[
-                    "Stand up and shake out your hands",
-                    "Roll your shoulders forward and back",
-                    "Gently twist your torso side to side",
-                    "March in place for 30 seconds",
-                    "End with three deep breaths"
-                ],
-                tone="gentle"
+            tone="calm"
+        ),
+        "movement_break": WellnessSuggestion(
+            module=WellnessModule.YOGA,
+            title="Quick Movement Break",
+            description="Gentle movement to release stuck energy.",
+            duration="3-5 minutes",
+            instructions=(
+                "Stand up and shake out your hands",
+                "Roll your shoulders forward and back",
+                "Gently twist your torso side to side",
+                "March in place for 30 seconds",
+                "End with three deep breaths"
             ),
-            "emotional_release": WellnessSuggestion(
-                module=WellnessModule.JOURNALING,
-                title="Emotional Release Writing",
-                description="Write freely to release pent-up emotions.",
-                duration="5-10 minutes",
-                instructions=[
-                    "Grab paper or open a notes app",
-                    "Write 'I feel...' and keep going",
-                    "Don't censor or edit yourself",
-                    "Let all emotions flow onto the page",
-                    "You can tear it up or delete it after"
-                ],
-                tone="gentle"
+            tone="gentle"
+        ),
+        "emotional_release": WellnessSuggestion(
+            module=WellnessModule.JOURNALING,
+            title="Emotional Release Writing",
+            description="Write freely to release pent-up emotions.",
+            duration="5-10 minutes",
+            instructions=(
+                "Grab paper or open a notes app",
+                "Write 'I feel...' and keep going",
+                "Don't censor or edit yourself",
+                "Let all emotions flow onto the page",
+                "You can tear it up or delete it after"
             ),
-            "color_breathing": WellnessSuggestion(
-                module=WellnessModule.BREATHING,
-                title="Color Breathing",
-                description="Combine visualization with breathing for calm.",
-                duration="3-4 minutes",
-                instructions=[
-                    "Breathe in and imagine a calming blue light",
-                    "Feel it fill your body with peace",
-                    "Breathe out and imagine gray stress leaving",
-                    "Watch it dissolve into the air",
-                    "Repeat until you feel lighter"
-                ],
-                tone="soft"
-            )
+            tone="gentle"
+        ),
+        "color_breathing": WellnessSuggestion(
+            module=WellnessModule.BREATHING,
+            title="Color Breathing",
+            description="Combine visualization with breathing for calm.",
+            duration="3-4 minutes",
+            instructions=(
+                "Breathe in and imagine a calming blue light",
+                "Feel it fill your body with peace",
+                "Breathe out and imagine gray stress leaving",
+                "Watch it dissolve into the air",
+                "Repeat until you feel lighter"
+            ),
+            tone="soft"
+        )
+    }
+
+
+# Activity definitions, built once at import and shared read-only
+_ACTIVITIES: Mapping[str, WellnessSuggestion] = MappingProxyType(_build_activities())
+
+
+class WellnessEngine:
+    """
+    Maps detected emotions to appropriate wellness activities.
+    
+    Core principle: Suggest ONE small, achievable activity
+    Never overwhelming, always optional
+    
+    UPDATED: Now supports get_all_suggestions() for 4 wellness cards
+    """
+    
+    # Suggestion framing, indexed by Intensity
+    _INTROS = (
+        "You might find it helpful to try",  # LOW
+        "You might find it helpful to try",  # MILD
+        "If it feels right, you might try",  # MODERATE
+        "If you'd like, there's something gentle that might help",  # HIGH
+        "If you'd like, there's something gentle that might help",  # CRISIS
+    )
+    
+    def __init__(self):
+        # Emotion to module mapping from config (lists keep the order,
+        # sets answer membership)
+        self.emotion_modules = config.emotion.emotion_modules
+        self._emotion_module_sets = {
+            emotion: frozenset(modules)
+            for emotion, modules in self.emotion_modules.items()
+        }
+        
+        # Detailed wellness activities (shared, read-only)
+        self.activities = _ACTIVITIES
+        
+        # Extended emotion-specific activity lists
+        # Uses emotion names from prosody detector: anger, happy, sad, neutral
+        # Aliases share one tuple
+        self.emotion_activity_map = {
+            "sad": _SAD_ACTIVITIES,
+            "sadness": _SAD_ACTIVITIES,
+            "anger": _ANGER_ACTIVITIES,
+            "angry": _ANGER_ACTIVITIES,
+            "happy": _HAPPY_ACTIVITIES,
+            "joy": _HAPPY_ACTIVITIES,
+            "neutral": _NEUTRAL_ACTIVITIES,
+            "fear": _FEAR_ACTIVITIES,
+            "anxiety": _ANXIETY_ACTIVITIES,
+        }
+        
+        # Activity names resolved to suggestion objects once; unknown
+        # names are dropped here instead of checked per lookup
+        self.emotion_activity_resolved = {
+            emotion: self._resolve_activities(names)
+            for emotion, names in self.emotion_activity_map.items()
+        }
+        self._calming_priority = self._resolve_activities(_CALMING_PRIORITY_ACTIVITIES)
+        self._general_fallbacks = self._resolve_activities(_GENERAL_FALLBACK_ACTIVITIES)
+        
+        # Suggestion ordering for every known (emotion, intensity) pair,
+        # built once so get_all_suggestions is a lookup and a slice
+        self._suggestion_index = {
+            (emotion, intensity): self._build_suggestion_order(emotion, intensity)
+            for emotion in self.emotion_activity_map
+            for intensity in INTENSITY_LEVELS
+        }
+        
+        # Card-listing view of the same orderings: header fields only
+        self._card_header_index = {
+            key: tuple(self._card_header(suggestion) for suggestion in ordered)
+            for key, ordered in self._suggestion_index.items()
         }
     
     def get_all_suggestions(
         self,
         emotion_result,
         count: int = 4
-    ) -> List[WellnessSuggestion]:
+    ) -> Sequence[WellnessSuggestion]:
         """
         Get multiple wellness suggestions for the detected emotion.
         
@@ -479,57 +538,106 @@ class WellnessEngine:
             count: Number of suggestions to return (default 4)
             
         Returns:
-            List of WellnessSuggestions
+            Tuple of WellnessSuggestions, shared between callers
+            (use list() for a mutable copy)
         """
-        # Handle both FusedEmotionResult and simple objects
-        if hasattr(emotion_result, 'primary_emotion'):
-            primary_emotion = emotion_result.primary_emotion
-        else:
-            primary_emotion = str(emotion_result)
+        key = self._suggestion_key(emotion_result)
+        
+        # Any count is a prefix of the full ordering
+        ordered = self._suggestion_index.get(key)
+        if ordered is None:
+            ordered = self._build_suggestion_order(*key)
+        
+        return ordered[:count]
+    
+    def get_card_headers(
+        self,
+        emotion_result,
+        count: int = 4
+    ) -> Sequence[tuple[str, str, str, str]]:
+        """
+        Get (title, description, duration, tone) for the suggestion cards.
+        
+        Same suggestions and order as get_all_suggestions, for listings
+        that don't show instructions until a card is opened.
+        
+        Args:
+            emotion_result: Object with primary_emotion and intensity_level attributes
+            count: Number of cards to return (default 4)
+            
+        Returns:
+            Tuple of header tuples
+        """
+        key = self._suggestion_key(emotion_result)
         
-        if hasattr(emotion_result, 'intensity_level'):
+        headers = self._card_header_index.get(key)
+        if headers is None:
+            headers = tuple(
+                self._card_header(suggestion)
+                for suggestion in self._build_suggestion_order(*key)
+            )
+        
+        return headers[:count]
+    
+    @staticmethod
+    def _suggestion_key(emotion_result) -> tuple[str, str]:
+        """Normalize an emotion result to an (emotion, intensity) index key."""
+        # FusedEmotionResult is the common case; anything else is duck-typed
+        if isinstance(emotion_result, FusedEmotionResult):
+            primary_emotion = emotion_result.primary_emotion
             intensity = emotion_result.intensity_level
         else:
-            intensity = "moderate"
+            primary_emotion = getattr(emotion_result, 'primary_emotion', None)
+            if primary_emotion is None:
+                primary_emotion = str(emotion_result)
+            intensity = getattr(emotion_result, 'intensity_level', "moderate")
         
         # Normalize emotion name
-        primary_emotion = primary_emotion.lower()
+        return primary_emotion.lower(), intensity
+    
+    @staticmethod
+    def _card_header(suggestion: WellnessSuggestion) -> tuple[str, str, str, str]:
+        """Header fields shown on a suggestion card."""
+        return (suggestion.title, suggestion.description, suggestion.duration, suggestion.tone)
+    
+    def _resolve_activities(self, names) -> tuple[WellnessSuggestion, ...]:
+        """Map activity names to their suggestions, skipping unknown names."""
+        return tuple(self.activities[name] for name in names if name in self.activities)
+    
+    def _build_suggestion_order(
+        self,
+        primary_emotion: str,
+        intensity: str
+    ) -> tuple[WellnessSuggestion, ...]:
+        """
+        Full, deduplicated suggestion ordering for an emotion and intensity.
         
+        Calming activities first for high intensity, then the
+        emotion-specific ones, then general fallbacks.
+        """
         # Get activities for this emotion
-        available_activities = self.emotion_activity_map.get(
+        available_activities = self.emotion_activity_resolved.get(
             primary_emotion,
-            self.emotion_activity_map["neutral"]
+            self.emotion_activity_resolved["neutral"]
         )
         
-        suggestions = []
-        
         # For high intensity, prioritize calming activities first
-        if intensity in ["high", "crisis"]:
-            priority_activities = [
-                "breathing", "box_breathing", "grounding", 
-                "safety_grounding", "reassurance", "cold_water_reset"
-            ]
-            for activity in priority_activities:
-                if activity in self.activities and len(suggestions) < count:
-                    suggestions.append(self.activities[activity])
+        if Intensity.from_level(intensity) >= Intensity.HIGH:
+            candidates = self._calming_priority + available_activities
+        else:
+            candidates = available_activities
         
-        # Add activities specific to the emotion
-        for activity in available_activities:
-            if activity in self.activities:
-                if self.activities[activity] not in suggestions:
-                    suggestions.append(self.activities[activity])
-                if len(suggestions) >= count:
-                    break
+        # Then the general ones
+        candidates += self._general_fallbacks
         
-        # If we still need more, add general ones
-        general_fallbacks = ["breathing", "mindfulness", "grounding", "gratitude"]
-        for activity in general_fallbacks:
-            if len(suggestions) >= count:
-                break
-            if activity in self.activities and self.activities[activity] not in suggestions:
-                suggestions.append(self.activities[activity])
+        suggestions = []
+        seen = set()
+        for obj in candidates:
+            if obj not in seen:
+                seen.add(obj)
+                suggestions.append(obj)
         
-        return suggestions[:count]
+        return tuple(suggestions)
     
     def get_suggestion(
         self,
@@ -545,7 +653,6 @@ class WellnessEngine:
             Single WellnessSuggestion (never multiple)
         """
         primary_emotion = emotion_result.primary_emotion
-        intensity = emotion_result.intensity_level
         
         # Get modules for this emotion
         available_modules = self.emotion_modules.get(
@@ -554,11 +661,14 @@ class WellnessEngine:
         )
         
         # Prioritize based on intensity
-        if intensity in ["high", "crisis"]:
+        if emotion_result.intensity_rank >= Intensity.HIGH:
             # For high intensity, prefer grounding and breathing
-            priority_modules = ["breathing", "grounding", "safety_grounding", "reassurance"]
-            for module in priority_modules:
-                if module in available_modules:
+            available_set = self._emotion_module_sets.get(
+                primary_emotion,
+                self._emotion_module_sets["neutral"]
+            )
+            for module in _PRIORITY_MODULES:
+                if module in available_set:
                     return self.activities.get(module, self.activities["breathing"])
         
         # Select from available modules
@@ -578,25 +688,16 @@ class WellnessEngine:
         Format suggestion as natural text for response.
         Framed as invitation, not command.
         """
-        intensity = emotion_result.intensity_level
-        
         # Soft framing based on intensity
-        if intensity in ["high", "crisis"]:
-            intro = "If you'd like, there's something gentle that might help"
-        elif intensity == "moderate":
-            intro = "If it feels right, you might try"
-        else:
-            intro = "You might find it helpful to try"
-        
-        # Build suggestion text
-        text = f"{intro}: {suggestion.title.lower()}. "
-        text += f"{suggestion.description} "
+        intro = self._INTROS[emotion_result.intensity_rank]
         
         # Add brief instruction
         if suggestion.instructions:
-            text += f"You could start by {suggestion.instructions[0].lower()}."
+            first_step = f"You could start by {suggestion.first_instruction_lower}."
+        else:
+            first_step = ""
         
-        return text
+        return f"{intro}: {suggestion.title_lower}. {suggestion.description} {first_step}"
     
     def should_skip_suggestion(
         self,
@@ -610,14 +711,19 @@ class WellnessEngine:
         - Very high distress
         - User needs comfort, not advice
         """
-        if emotion_result.requires_crisis_response:
-            return True
-        
-        if emotion_result.intensity_level == "crisis":
-            return True
-        
-        return False
+        return emotion_result.requires_crisis_response or emotion_result.intensity_rank >= Intensity.CRISIS
+
+
+# Singleton instance (created on first use)
+@functools.cache
+def _default_engine() -> WellnessEngine:
+    """Shared engine, created on first use instead of at import."""
+    return WellnessEngine()
 
 
-# Singleton instance
-wellness_engine = WellnessEngine()
\ No newline at end of file
+def __getattr__(name):
+    # `wellness_engine` stays importable without building the suggestion
+    # indexes at import time
+    if name == "wellness_engine":
+        return _default_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
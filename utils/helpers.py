@@ -2,18 +2,47 @@
 Utility helper functions for the Mental Wellness Companion.
 """
 
+import os
+import re
 import sys
+from typing import Optional
+
 from loguru import logger
 
 
-def setup_logging(level: str = "INFO"):
+# TTS character replacements: straight and curly double quotes are
+# dropped, curly single quotes, dashes and ellipses are normalized
+_TTS_TRANSLATE = str.maketrans({
+    '"': '',
+    '\u201c': '',
+    '\u201d': '',
+    '\u2018': "'",
+    '\u2019': "'",
+    '\u2014': '-',
+    '\u2013': '-',
+    '\u2026': '...',
+})
+
+_WS_RE = re.compile(r'\s+')
+
+
+def setup_logging(
+    level: str = "INFO",
+    file_sink: Optional[bool] = None,
+    log_dir: Optional[str] = None
+):
     """
     Setup loguru logging configuration.
     
+    Safe to call more than once: existing handlers are replaced.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
+        file_sink: Also log to a rotating file. Defaults to the
+            WELLNESS_LOG_FILE environment variable ("1"/"true"/"yes")
+        log_dir: Directory for log files (default "logs")
     """
-    # Remove default handler
+    # Remove default (and any previously added) handlers
     logger.remove()
     
     # Add custom handler with format
@@ -24,14 +53,20 @@ def setup_logging(level: str = "INFO"):
         colorize=True
     )
     
-    # Also log to file
-    logger.add(
-        "logs/wellness_{time}.log",
-        rotation="1 day",
-        retention="7 days",
-        level=level,
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
-    )
+    if file_sink is None:
+        file_sink = os.getenv("WELLNESS_LOG_FILE", "").lower() in ("1", "true", "yes")
+    
+    # Optionally also log to file; enqueue moves formatting and
+    # writes off the calling thread
+    if file_sink:
+        logger.add(
+            os.path.join(log_dir or "logs", "wellness_{time}.log"),
+            rotation="1 day",
+            retention="7 days",
+            level=level,
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+            enqueue=True
+        )
     
     logger.info(f"Logging initialized at {level} level")
 
@@ -47,17 +82,22 @@ def format_duration(seconds: float) -> str:
         Formatted string like "1m 30s" or "45s"
     """
     if seconds < 60:
-        return f"{seconds:.1f}s"
+        # Whole seconds skip float formatting
+        return f"{seconds:.1f}s" if seconds % 1 else f"{int(seconds)}s"
     
-    minutes = int(seconds // 60)
-    remaining_seconds = seconds % 60
+    # Integer minutes/seconds; rounding first avoids "1m 60s"
+    minutes, remaining_seconds = divmod(round(seconds), 60)
     
-    if remaining_seconds > 0:
-        return f"{minutes}m {remaining_seconds:.0f}s"
+    if remaining_seconds:
+        return f"{minutes}m {remaining_seconds}s"
     return f"{minutes}m"
 
 
-def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
+_DEFAULT_SUFFIX = "..."
+_DEFAULT_SUFFIX_LEN = len(_DEFAULT_SUFFIX)
+
+
+def truncate_text(text: str, max_length: int = 100, suffix: str = _DEFAULT_SUFFIX) -> str:
     """
     Truncate text to maximum length with suffix.
     
@@ -71,6 +111,8 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     """
     if len(text) <= max_length:
         return text
+    if suffix is _DEFAULT_SUFFIX:
+        return text[:max_length - _DEFAULT_SUFFIX_LEN] + _DEFAULT_SUFFIX
     return text[:max_length - len(suffix)] + suffix
 
 
@@ -85,22 +127,8 @@ def clean_text_for_tts(text: str) -> str:
     Returns:
         Cleaned text
     """
-    # Replace common problematic characters
-    replacements = {
-        '"': '',
-        '"': '',
-        '"': '',
-        ''': "'",
-        ''': "'",
-        '—': '-',
-        '–': '-',
-        '…': '...',
-    }
-    
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+    # Replace common problematic characters in one pass
+    text = text.translate(_TTS_TRANSLATE)
     
     # Remove multiple spaces
-    text = ' '.join(text.split())
-    
-    return text.strip()
\ No newline at end of file
+    return _WS_RE.sub(' ', text).strip()
\ No newline at end of file